@@ -0,0 +1,15 @@
+from django.core.cache import cache
+
+LIST_GENERATION_KEY = 'blog:lists:generation'
+
+
+def list_cache_prefix():
+    generation = cache.get_or_set(LIST_GENERATION_KEY, 0, None)
+    return f'blog:lists:{generation}'
+
+
+def invalidate_list_cache():
+    try:
+        cache.incr(LIST_GENERATION_KEY)
+    except ValueError:
+        cache.set(LIST_GENERATION_KEY, 1, None)
@@ -1,2 +1,6 @@
 POSTS_LIMIT = 10
+COMMENTS_LIMIT = 20
 MAX_LENGTH = 256
+LIST_CACHE_TIMEOUT = 60
+COMMENTS_BATCH_SIZE = 500
+POST_PREVIEW_LENGTH = 500
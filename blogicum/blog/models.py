@@ -78,9 +78,17 @@ class Post(BaseModel):
     class Meta():
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        indexes = (
+            models.Index(fields=('-pub_date',),
+                         name='post_pub_date_desc_idx'),
+            models.Index(fields=('is_published', 'category', 'pub_date'),
+                         name='post_published_idx'),
+            models.Index(fields=('author', '-pub_date'),
+                         name='post_author_pub_date_idx'),
+        )
 
     def get_absolute_url(self):
-        return reverse("model_detail", kwargs={"username": self.author})
+        return reverse('blog:post_detail', kwargs={'post_pk': self.pk})
 
     def __str__(self) -> str:
         return self.title
@@ -97,3 +105,9 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ('pub_date',)
+        indexes = (
+            models.Index(fields=('post', 'pub_date'),
+                         name='comment_post_pub_date_idx'),
+            models.Index(fields=('author', 'post'),
+                         name='comment_author_post_idx'),
+        )
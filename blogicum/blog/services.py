@@ -0,0 +1,51 @@
+from django.db.models import Count
+from django.db.models.functions import Substr
+from django.utils import timezone
+
+from .cache import invalidate_list_cache
+from .constants import COMMENTS_BATCH_SIZE, POST_PREVIEW_LENGTH
+from .models import Comment, Post
+
+
+POST_LIST_FIELDS = (
+    'id', 'title', 'pub_date', 'image', 'is_published',
+    'author__username',
+    'category__slug', 'category__title', 'category__is_published',
+    'location__name', 'location__is_published',
+)
+
+
+def post_list_request(manager=Post.objects, published_only=True):
+    queryset = manager.select_related(
+        'location', 'author', 'category'
+    ).only(
+        *POST_LIST_FIELDS
+    )
+    if published_only:
+        queryset = queryset.filter(
+            pub_date__lte=timezone.now(),
+            is_published=True,
+            category__is_published=True
+        )
+    return queryset.annotate(
+        comment_count=Count('comment'),
+        text_preview=Substr('text', 1, POST_PREVIEW_LENGTH)
+    ).order_by(
+        '-pub_date'
+    )
+
+
+def post_list_iterator(manager=Post.objects, chunk_size=1000):
+    # Streams rows in chunks; the queryset result cache is not filled.
+    return post_list_request(manager).iterator(chunk_size=chunk_size)
+
+
+def bulk_add_comments(post, rows):
+    # bulk_create still fills the auto_now_add pub_date through pre_save,
+    # but skips post_save, so list caches are reset here.
+    comments = Comment.objects.bulk_create(
+        [Comment(post=post, **row) for row in rows],
+        batch_size=COMMENTS_BATCH_SIZE
+    )
+    invalidate_list_cache()
+    return comments
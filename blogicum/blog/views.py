@@ -1,48 +1,47 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models.functions import Now
+from django.core.paginator import Paginator
 from django.http import Http404
 from django.shortcuts import redirect, get_object_or_404
 from django.urls import reverse
+from django.views.decorators.cache import cache_page
 from django.views.generic import (
     CreateView, DeleteView, DetailView, ListView, UpdateView
 )
 
-from .constants import POSTS_LIMIT
+from .cache import list_cache_prefix
+from .constants import COMMENTS_LIMIT, LIST_CACHE_TIMEOUT, POSTS_LIMIT
 from .forms import CommentForm, PostForm
 from .models import Category, Comment, Post
+from .services import post_list_request
 
 User = get_user_model()
 
 
-def post_list_request(manager=Post.objects):
-    return manager.select_related(
-        'location', 'author', 'category'
-    ).filter(
-        pub_date__lte=Now(),
-        is_published=True,
-        category__is_published=True
-    ).order_by(
-        '-pub_date'
-    )
+class AnonymousCacheMixin:
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        return cache_page(
+            LIST_CACHE_TIMEOUT, key_prefix=list_cache_prefix()
+        )(super().dispatch)(request, *args, **kwargs)
 
 
-class ProfileListView(ListView):
+class ProfileListView(AnonymousCacheMixin, ListView):
     template_name = 'blog/profile.html'
     paginate_by = POSTS_LIMIT
     profile = None
 
-    def get_queryset(self):
+    def dispatch(self, request, *args, **kwargs):
         self.profile = get_object_or_404(User,
-                                         username=self.kwargs['username'])
+                                         username=kwargs['username'])
+        return super().dispatch(request, *args, **kwargs)
 
-        if self.request.user == self.profile:
-            return self.profile.post_set.select_related(
-                'location', 'author', 'category'
-            ).order_by(
-                '-pub_date'
-            )
-        return post_list_request(self.profile.post_set)
+    def get_queryset(self):
+        return post_list_request(
+            Post.objects.filter(author=self.profile),
+            published_only=self.request.user != self.profile
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -66,18 +65,22 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         return self.request.user
 
 
-class IndexListView(ListView):
-    queryset = post_list_request()
-    ordering = '-pub_date'
+class IndexListView(AnonymousCacheMixin, ListView):
     template_name = 'blog/index.html'
     paginate_by = POSTS_LIMIT
 
+    def get_queryset(self):
+        return post_list_request()
+
 
 class PostDetailView(DetailView):
     model = Post
     template_name: str = 'blog/detail.html'
     pk_url_kwarg = 'post_pk'
 
+    def get_queryset(self):
+        return Post.objects.select_related('author', 'category', 'location')
+
     def get_object(self):
         obj = super().get_object()
 
@@ -91,13 +94,22 @@ class PostDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = (
-            self.object.comment_set.select_related('author')
+        paginator = Paginator(
+            self.object.comment_set.select_related(
+                'author'
+            ).order_by(
+                'pub_date', 'pk'
+            ),
+            COMMENTS_LIMIT
+        )
+        context['page_obj'] = paginator.get_page(
+            self.request.GET.get('page')
         )
+        context['comments'] = context['page_obj']
         return context
 
 
-class CategoryPostsListView(ListView):
+class CategoryPostsListView(AnonymousCacheMixin, ListView):
     category_obj = None
     template_name = 'blog/category.html'
     paginate_by = POSTS_LIMIT
@@ -135,33 +147,31 @@ class PostCreateView(LoginRequiredMixin, PostMixin, CreateView):
                        kwargs={'username': self.request.user})
 
 
-class PostUpdateView(LoginRequiredMixin, PostMixin, UpdateView):
+class PostAuthorMixin(PostMixin):
     pk_url_kwarg = 'post_pk'
 
     def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(Post, pk=kwargs['post_pk'])
+        self.object = get_object_or_404(
+            Post.objects.select_related('author', 'category', 'location'),
+            pk=kwargs['post_pk']
+        )
 
-        if instance.author != request.user:
+        if self.object.author != request.user:
             return redirect('blog:post_detail',
                             post_pk=kwargs['post_pk'])
         return super().dispatch(request, *args, **kwargs)
 
+    def get_object(self, queryset=None):
+        return self.object
+
+
+class PostUpdateView(LoginRequiredMixin, PostAuthorMixin, UpdateView):
     def get_success_url(self) -> str:
         return reverse('blog:post_detail',
                        kwargs={'post_pk': self.object.pk})
 
 
-class PostDeleteView(LoginRequiredMixin, PostMixin, DeleteView):
-    pk_url_kwarg = 'post_pk'
-
-    def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(Post, pk=kwargs['post_pk'])
-
-        if instance.author != request.user:
-            return redirect('blog:post_detail',
-                            post_pk=kwargs['post_pk'])
-        return super().dispatch(request, *args, **kwargs)
-
+class PostDeleteView(LoginRequiredMixin, PostAuthorMixin, DeleteView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         form = PostForm(instance=self.object)
@@ -192,37 +202,37 @@ class CommentCreateView(LoginRequiredMixin, CommentBase, CreateView):
         return super().form_valid(form)
 
     def get_success_url(self) -> str:
-        return reverse('blog:post_detail', kwargs={'post_pk': self.post_.pk})
+        last_page = Paginator(
+            self.post_.comment_set.all(), COMMENTS_LIMIT
+        ).num_pages
+        return (
+            reverse('blog:post_detail', kwargs={'post_pk': self.post_.pk})
+            + f'?page={last_page}#comment_{self.object.pk}'
+        )
 
 
-class CommentUpdateView(LoginRequiredMixin, CommentBase, UpdateView):
-    form_class = CommentForm
+class CommentAuthorMixin(CommentBase):
     pk_url_kwarg = 'comment_pk'
 
     def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(Comment, pk=kwargs['comment_pk'])
+        self.object = get_object_or_404(Comment, pk=kwargs['comment_pk'])
 
-        if instance.author != request.user:
+        if self.object.author_id != request.user.id:
             return redirect('blog:post_detail',
                             post_pk=kwargs['post_pk'])
         return super().dispatch(request, *args, **kwargs)
 
+    def get_object(self, queryset=None):
+        return self.object
+
     def get_success_url(self) -> str:
         return reverse('blog:post_detail',
                        kwargs={'post_pk': self.kwargs['post_pk']})
 
 
-class CommentDeleteView(LoginRequiredMixin, CommentBase, DeleteView):
-    pk_url_kwarg = 'comment_pk'
-
-    def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(Comment, pk=kwargs['comment_pk'])
+class CommentUpdateView(LoginRequiredMixin, CommentAuthorMixin, UpdateView):
+    form_class = CommentForm
 
-        if instance.author != request.user:
-            return redirect('blog:post_detail',
-                            post_pk=kwargs['post_pk'])
-        return super().dispatch(request, *args, **kwargs)
 
-    def get_success_url(self) -> str:
-        return reverse('blog:post_detail',
-                       kwargs={'post_pk': self.kwargs['post_pk']})
+class CommentDeleteView(LoginRequiredMixin, CommentAuthorMixin, DeleteView):
+    pass
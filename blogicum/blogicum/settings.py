@@ -90,6 +90,21 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+# LocMemCache is per process: list cache invalidation only reaches the
+# worker that handled the write. With several workers use a shared backend
+# (Redis or Memcached), otherwise other workers serve pages up to
+# LIST_CACHE_TIMEOUT seconds old.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
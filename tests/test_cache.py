@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+from blog.models import Comment, Post
+
+INDEX_URL = "/"
+TITLE = "Cached title"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def cached_post(mixer, published_category):
+    author = mixer.blend(get_user_model(), username="cached_author")
+    location = mixer.blend(
+        "blog.Location", name="Old place", is_published=True
+    )
+    post = mixer.blend(
+        "blog.Post",
+        title=TITLE,
+        author=author,
+        category=published_category,
+        location=location,
+        is_published=True,
+        pub_date=timezone.now() - timedelta(days=1),
+    )
+    mixer.blend("blog.Comment", post=post, author=author)
+    return post
+
+
+def get_index_content(client):
+    return client.get(INDEX_URL).content.decode("utf-8")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_anonymous_page_served_from_cache(client, cached_post):
+    assert TITLE in get_index_content(client)
+    Post.objects.filter(pk=cached_post.pk).update(title="Silent update")
+    content = get_index_content(client)
+    assert TITLE in content, (
+        "Убедитесь, что анонимный пользователь получает ленту из кеша."
+    )
+    assert "Silent update" not in content
+
+
+@pytest.mark.django_db(transaction=True)
+def test_authenticated_user_bypasses_cache(client, user_client, cached_post):
+    assert TITLE in get_index_content(client)
+    Post.objects.filter(pk=cached_post.pk).update(title="Silent update")
+    assert "Silent update" in get_index_content(user_client), (
+        "Убедитесь, что авторизованный пользователь не получает ленту из кеша."
+    )
+
+
+def edit_post(post, mixer):
+    post.title = "Fresh title"
+    post.save()
+    return "Fresh title", True
+
+
+def delete_post(post, mixer):
+    post.delete()
+    return TITLE, False
+
+
+def add_comment(post, mixer):
+    mixer.blend("blog.Comment", post=post, author=post.author)
+    return "Комментарии (2)", True
+
+
+def delete_comment(post, mixer):
+    Comment.objects.get(post=post).delete()
+    return "Комментарии (0)", True
+
+
+def unpublish_category(post, mixer):
+    post.category.is_published = False
+    post.category.save()
+    return TITLE, False
+
+
+def delete_category(post, mixer):
+    post.category.delete()
+    return TITLE, False
+
+
+def rename_location(post, mixer):
+    post.location.name = "New place"
+    post.location.save()
+    return "New place", True
+
+
+def delete_location(post, mixer):
+    post.location.delete()
+    return "Old place", False
+
+
+def rename_user(post, mixer):
+    post.author.username = "renamed_author"
+    post.author.save()
+    return "@renamed_author", True
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize(
+    "change",
+    [
+        edit_post, delete_post,
+        add_comment, delete_comment,
+        unpublish_category, delete_category,
+        rename_location, delete_location,
+        rename_user,
+    ],
+)
+def test_change_invalidates_cache(client, mixer, cached_post, change):
+    assert TITLE in get_index_content(client)
+    marker, expected = change(cached_post, mixer)
+    content = get_index_content(client)
+    assert (marker in content) is expected, (
+        f"Убедитесь, что после `{change.__name__}` лента для анонимного"
+        " пользователя обновляется."
+    )
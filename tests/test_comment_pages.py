@@ -0,0 +1,50 @@
+import pytest
+
+from blog.constants import COMMENTS_LIMIT
+from blog.models import Comment
+
+
+@pytest.fixture
+def many_comments(mixer, post_with_published_location):
+    return [
+        mixer.blend(
+            "blog.Comment",
+            post=post_with_published_location,
+            author=post_with_published_location.author,
+            text=f"Comment #{i:02d}",
+        )
+        for i in range(COMMENTS_LIMIT + 1)
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_comments_second_page(
+        user_client, post_with_published_location, many_comments):
+    url = f"/posts/{post_with_published_location.id}/"
+    first_page = user_client.get(url).content.decode("utf-8")
+    second_page = user_client.get(f"{url}?page=2").content.decode("utf-8")
+    first, last = many_comments[0].text, many_comments[-1].text
+    assert first in first_page and last not in first_page, (
+        "Убедитесь, что на первой странице поста выводятся первые"
+        f" {COMMENTS_LIMIT} комментариев."
+    )
+    assert last in second_page and first not in second_page, (
+        "Убедитесь, что комментарии сверх первой страницы доступны"
+        " по параметру `?page=2`."
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_new_comment_redirects_to_last_page(
+        user_client, post_with_published_location, many_comments):
+    post_id = post_with_published_location.id
+    response = user_client.post(
+        f"/posts/{post_id}/comment/", data={"text": "Newest comment"}
+    )
+    comment = Comment.objects.get(text="Newest comment")
+    assert response.url == (
+        f"/posts/{post_id}/?page=2#comment_{comment.pk}"
+    ), (
+        "Убедитесь, что после добавления комментария пользователь попадает"
+        " на последнюю страницу комментариев, к своему комментарию."
+    )
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from blog.cache import LIST_GENERATION_KEY
+from blog.services import (
+    bulk_add_comments, post_list_iterator, post_list_request
+)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_add_comments(user, post_with_published_location):
+    cache.set(LIST_GENERATION_KEY, 0, None)
+    rows = [{"author": user, "text": f"Bulk {i}"} for i in range(3)]
+    bulk_add_comments(post_with_published_location, rows)
+    comments = post_with_published_location.comment_set.all()
+    assert sorted(c.text for c in comments) == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert all(c.pub_date is not None for c in comments)
+    assert cache.get(LIST_GENERATION_KEY) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_post_list_iterator(mixer, user, published_category):
+    posts = mixer.cycle(5).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() - timedelta(days=1),
+    )
+    iterated = list(post_list_iterator(chunk_size=2))
+    assert [p.pk for p in iterated] == [
+        p.pk for p in post_list_request()
+    ]
+    assert {p.pk for p in iterated} == {p.pk for p in posts}